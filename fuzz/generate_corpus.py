@@ -6,13 +6,50 @@ Creates valid and edge-case serialized data to seed the fuzzer
 for better coverage of the deserialization code.
 """
 
-import os
 import struct
 from pathlib import Path
 
+# Precompiled little-endian formats, shared by every seed generator
+_I16 = struct.Struct("<h")
+_U16 = struct.Struct("<H")
+_I32 = struct.Struct("<i")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_U64 = struct.Struct("<Q")
+_F32 = struct.Struct("<f")
+_F64 = struct.Struct("<d")
 
-def generate_value_corpus(output_dir: Path):
-    """Generate seed corpus for value deserialization."""
+# Length/count prefixes shared by several edge-case seeds
+_EMPTY_U32 = b"\x00\x00\x00\x00"
+_MAX_U32 = b"\xff\xff\xff\xff"
+
+# Fixed payloads reused by the value seeds
+_B_TRUE = b"\x01"
+_B_FALSE = b"\x00"
+_ALL_BYTES = bytes(range(256))
+
+
+def make_value(name: bytes, type_byte: int, data: bytes) -> bytes:
+    """Create a serialized value."""
+    return _U32.pack(len(name)) + name + bytes((type_byte,)) + data
+
+
+def make_container(values: list) -> bytes:
+    """Create a serialized container."""
+    return _U32.pack(len(values)) + b"".join(values)
+
+
+def write_corpus(output_dir: Path, files: dict[str, bytes]):
+    """Write each named seed payload into output_dir."""
+    for name, data in files.items():
+        (output_dir / name).write_bytes(data)
+
+
+def generate_value_corpus(output_dir: Path) -> int:
+    """Generate seed corpus for value deserialization.
+
+    Returns the number of seed files written.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Valid value types (based on value_types enum)
@@ -31,146 +68,98 @@ def generate_value_corpus(output_dir: Path):
     # 12 = container_value
     # 13 = array_value
 
-    def make_value(name: bytes, type_byte: int, data: bytes) -> bytes:
-        """Create a serialized value."""
-        name_len = struct.pack("<I", len(name))
-        return name_len + name + bytes([type_byte]) + data
-
-    # Null value
-    with open(output_dir / "null_value", "wb") as f:
-        f.write(make_value(b"null_test", 0, b""))
-
-    # Bool values
-    with open(output_dir / "bool_true", "wb") as f:
-        f.write(make_value(b"bool_true", 1, bytes([1])))
-
-    with open(output_dir / "bool_false", "wb") as f:
-        f.write(make_value(b"bool_false", 1, bytes([0])))
-
-    # Int16 value
-    with open(output_dir / "int16_value", "wb") as f:
-        f.write(make_value(b"short", 2, struct.pack("<h", -12345)))
-
-    # Uint16 value
-    with open(output_dir / "uint16_value", "wb") as f:
-        f.write(make_value(b"ushort", 3, struct.pack("<H", 65000)))
-
-    # Int32 value
-    with open(output_dir / "int32_value", "wb") as f:
-        f.write(make_value(b"int", 4, struct.pack("<i", -123456789)))
-
-    # Uint32 value
-    with open(output_dir / "uint32_value", "wb") as f:
-        f.write(make_value(b"uint", 5, struct.pack("<I", 0xDEADBEEF)))
-
-    # Int64 value
-    with open(output_dir / "int64_value", "wb") as f:
-        f.write(make_value(b"llong", 6, struct.pack("<q", -9223372036854775807)))
-
-    # Uint64 value
-    with open(output_dir / "uint64_value", "wb") as f:
-        f.write(make_value(b"ullong", 7, struct.pack("<Q", 0xDEADBEEFCAFEBABE)))
-
-    # Float value
-    with open(output_dir / "float_value", "wb") as f:
-        f.write(make_value(b"float", 8, struct.pack("<f", 3.14159)))
-
-    # Double value
-    with open(output_dir / "double_value", "wb") as f:
-        f.write(make_value(b"double", 9, struct.pack("<d", 2.718281828459045)))
+    files = {
+        # Null value
+        "null_value": make_value(b"null_test", 0, b""),
+        # Bool values
+        "bool_true": make_value(b"bool_true", 1, _B_TRUE),
+        "bool_false": make_value(b"bool_false", 1, _B_FALSE),
+        # Int16 value
+        "int16_value": make_value(b"short", 2, _I16.pack(-12345)),
+        # Uint16 value
+        "uint16_value": make_value(b"ushort", 3, _U16.pack(65000)),
+        # Int32 value
+        "int32_value": make_value(b"int", 4, _I32.pack(-123456789)),
+        # Uint32 value
+        "uint32_value": make_value(b"uint", 5, _U32.pack(0xDEADBEEF)),
+        # Int64 value
+        "int64_value": make_value(b"llong", 6, _I64.pack(-9223372036854775807)),
+        # Uint64 value
+        "uint64_value": make_value(b"ullong", 7, _U64.pack(0xDEADBEEFCAFEBABE)),
+        # Float value
+        "float_value": make_value(b"float", 8, _F32.pack(3.14159)),
+        # Double value
+        "double_value": make_value(b"double", 9, _F64.pack(2.718281828459045)),
+    }
 
     # String value
     test_string = b"Hello, World!"
-    string_data = struct.pack("<I", len(test_string)) + test_string
-    with open(output_dir / "string_value", "wb") as f:
-        f.write(make_value(b"string", 11, string_data))
+    string_data = _U32.pack(len(test_string)) + test_string
+    files["string_value"] = make_value(b"string", 11, string_data)
 
     # Bytes value
-    test_bytes = bytes(range(256))
-    bytes_data = struct.pack("<I", len(test_bytes)) + test_bytes
-    with open(output_dir / "bytes_value", "wb") as f:
-        f.write(make_value(b"bytes", 10, bytes_data))
+    bytes_data = _U32.pack(len(_ALL_BYTES)) + _ALL_BYTES
+    files["bytes_value"] = make_value(b"bytes", 10, bytes_data)
 
     # Edge cases
-    with open(output_dir / "empty", "wb") as f:
-        f.write(b"")
+    files.update({
+        "empty": b"",
+        "minimal": _EMPTY_U32,
+        "truncated_name_len": b"\xFF\xFF",  # Incomplete length
+        "huge_name_len": _MAX_U32 + b"x",
+        "invalid_type": make_value(b"test", 255, _EMPTY_U32),
+        "zero_name": make_value(b"", 4, _I32.pack(42)),
+    })
 
-    with open(output_dir / "minimal", "wb") as f:
-        f.write(b"\x00\x00\x00\x00")
+    write_corpus(output_dir, files)
 
-    with open(output_dir / "truncated_name_len", "wb") as f:
-        f.write(b"\xFF\xFF")  # Incomplete length
+    print(f"Generated {len(files)} seed files in {output_dir}")
+    return len(files)
 
-    with open(output_dir / "huge_name_len", "wb") as f:
-        f.write(struct.pack("<I", 0xFFFFFFFF) + b"x")
 
-    with open(output_dir / "invalid_type", "wb") as f:
-        f.write(make_value(b"test", 255, b"\x00\x00\x00\x00"))
+def generate_container_corpus(output_dir: Path) -> int:
+    """Generate seed corpus for container deserialization.
 
-    with open(output_dir / "zero_name", "wb") as f:
-        f.write(make_value(b"", 4, struct.pack("<i", 42)))
-
-    print(f"Generated {len(list(output_dir.iterdir()))} seed files in {output_dir}")
-
-
-def generate_container_corpus(output_dir: Path):
-    """Generate seed corpus for container deserialization."""
+    Returns the number of seed files written.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    def make_value(name: bytes, type_byte: int, data: bytes) -> bytes:
-        """Create a serialized value."""
-        name_len = struct.pack("<I", len(name))
-        return name_len + name + bytes([type_byte]) + data
-
-    def make_container(values: list) -> bytes:
-        """Create a serialized container."""
-        count = struct.pack("<I", len(values))
-        return count + b"".join(values)
-
-    # Empty container
-    with open(output_dir / "empty_container", "wb") as f:
-        f.write(make_container([]))
-
-    # Single value container
-    with open(output_dir / "single_value", "wb") as f:
-        value = make_value(b"test", 4, struct.pack("<i", 42))
-        f.write(make_container([value]))
-
-    # Multiple values container
-    with open(output_dir / "multiple_values", "wb") as f:
-        values = [
-            make_value(b"int_val", 4, struct.pack("<i", 123)),
-            make_value(b"bool_val", 1, bytes([1])),
-            make_value(b"str_val", 11, struct.pack("<I", 4) + b"test"),
-        ]
-        f.write(make_container(values))
-
-    # Large count (edge case)
-    with open(output_dir / "huge_count", "wb") as f:
-        f.write(struct.pack("<I", 0xFFFFFFFF))
-
-    # Corrupted container
-    with open(output_dir / "corrupted", "wb") as f:
-        f.write(struct.pack("<I", 5) + b"\x00" * 10)  # Claims 5 values but data is garbage
-
-    # Edge cases
-    with open(output_dir / "empty", "wb") as f:
-        f.write(b"")
-
-    with open(output_dir / "partial_count", "wb") as f:
-        f.write(b"\x01\x00")  # Incomplete count
-
-    print(f"Generated {len(list(output_dir.iterdir()))} seed files in {output_dir}")
+    files = {
+        # Empty container
+        "empty_container": make_container([]),
+        # Single value container
+        "single_value": make_container([
+            make_value(b"test", 4, _I32.pack(42)),
+        ]),
+        # Multiple values container
+        "multiple_values": make_container([
+            make_value(b"int_val", 4, _I32.pack(123)),
+            make_value(b"bool_val", 1, _B_TRUE),
+            make_value(b"str_val", 11, _U32.pack(4) + b"test"),
+        ]),
+        # Large count (edge case)
+        "huge_count": _MAX_U32,
+        # Corrupted container: claims 5 values but data is garbage
+        "corrupted": _U32.pack(5) + b"\x00" * 10,
+        # Edge cases
+        "empty": b"",
+        "partial_count": b"\x01\x00",  # Incomplete count
+    }
+
+    write_corpus(output_dir, files)
+
+    print(f"Generated {len(files)} seed files in {output_dir}")
+    return len(files)
 
 
 def main():
     base_dir = Path("corpus")
 
-    generate_value_corpus(base_dir / "deserialize")
-    generate_container_corpus(base_dir / "container")
+    total = generate_value_corpus(base_dir / "deserialize")
+    total += generate_container_corpus(base_dir / "container")
 
     print("\nCorpus generation complete!")
-    print(f"Total files: {sum(1 for _ in base_dir.rglob('*') if _.is_file())}")
+    print(f"Total files: {total}")
 
 
 if __name__ == "__main__":
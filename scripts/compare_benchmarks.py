@@ -9,32 +9,66 @@ and generates a markdown report with the comparison.
 import argparse
 import json
 import sys
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
+try:
+    # Optional C-accelerated decoder; the stdlib json module is the fallback
+    import orjson
+except ImportError:
+    orjson = None
 
-def load_benchmarks(filepath: str) -> dict[str, dict[str, Any]]:
-    """Load benchmark results from JSON file."""
-    with open(filepath) as f:
-        data = json.load(f)
+# Aggregate rows Google Benchmark appends as a trailing "_<aggregate>" suffix
+_AGGREGATE_NAMES = frozenset({'mean', 'median', 'stddev', 'cv'})
+
+
+class BenchmarkResult(NamedTuple):
+    """Comparison of one benchmark between the base and PR runs."""
+    name: str
+    base_time: float
+    pr_time: float
+    change: float  # Relative change, e.g. 0.25 for 25% slower
+    time_unit: str
+
+
+def _decode_json(raw: bytes) -> Any:
+    """Decode JSON bytes, preferring orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Google Benchmark writes bare NaN counters (e.g. in cv
+            # aggregates), which strict JSON decoders reject
+            pass
+    return json.loads(raw)
+
+
+def load_benchmarks(filepath: str) -> dict[str, tuple[float, str]]:
+    """Load benchmark results from JSON file.
+
+    Returns:
+        Mapping of benchmark name to (real_time, time_unit)
+    """
+    data = _decode_json(Path(filepath).read_bytes())
 
     # Handle Google Benchmark output format
     benchmarks = {}
     for bench in data.get('benchmarks', []):
         name = bench.get('name', '')
-        # Skip aggregate entries (mean, median, stddev)
-        if '_mean' in name or '_median' in name or '_stddev' in name or '_cv' in name:
+        # Skip aggregate entries (mean, median, stddev, cv)
+        if name.rpartition('_')[2] in _AGGREGATE_NAMES:
             continue
-        benchmarks[name] = bench
+        benchmarks[name] = (bench.get('real_time', 0), bench.get('time_unit', 'ns'))
 
     return benchmarks
 
 
 def compare_benchmarks(
-    base: dict[str, dict[str, Any]],
-    pr: dict[str, dict[str, Any]],
+    base: dict[str, tuple[float, str]],
+    pr: dict[str, tuple[float, str]],
     threshold: float
-) -> tuple[list[dict], list[dict], list[dict]]:
+) -> tuple[list[BenchmarkResult], list[BenchmarkResult], list[BenchmarkResult]]:
     """Compare base and PR benchmark results.
 
     Args:
@@ -43,35 +77,25 @@ def compare_benchmarks(
         threshold: Regression threshold (e.g., 0.10 for 10%)
 
     Returns:
-        Tuple of (regressions, improvements, unchanged)
+        Tuple of (regressions, improvements, unchanged). Regressions are
+        ordered worst first and improvements best first.
     """
     regressions = []
     improvements = []
     unchanged = []
 
-    for name, base_bench in base.items():
+    for name, (base_time, time_unit) in base.items():
         if name not in pr:
             continue
 
-        pr_bench = pr[name]
-
         # Use real_time for comparison (nanoseconds)
-        base_time = base_bench.get('real_time', 0)
-        pr_time = pr_bench.get('real_time', 0)
+        pr_time = pr[name][0]
 
         if base_time == 0:
             continue
 
         change = (pr_time - base_time) / base_time
-
-        result = {
-            'name': name,
-            'base_time': base_time,
-            'pr_time': pr_time,
-            'change': change,
-            'change_pct': change * 100,
-            'time_unit': base_bench.get('time_unit', 'ns')
-        }
+        result = BenchmarkResult(name, base_time, pr_time, change, time_unit)
 
         if change > threshold:
             regressions.append(result)
@@ -80,65 +104,88 @@ def compare_benchmarks(
         else:
             unchanged.append(result)
 
+    by_change = attrgetter('change')
+    regressions.sort(key=by_change, reverse=True)
+    improvements.sort(key=by_change)
+
     return regressions, improvements, unchanged
 
 
+# Display scales for nanosecond values, largest first
+_NS_SCALES = ((1_000_000, 'ms'), (1_000, 'us'))
+
+# Per-row table templates: name, base time, PR time, change in percent
+_REGRESSION_ROW = "| `%s` | %s | %s | **+%.1f%%** :warning: |"
+_IMPROVEMENT_ROW = "| `%s` | %s | %s | **%.1f%%** :chart_with_downwards_trend: |"
+
+
 def format_time(value: float, unit: str) -> str:
     """Format time value with appropriate unit."""
-    if unit == 'ns' and value >= 1000000:
-        return f"{value / 1000000:.2f}ms"
-    elif unit == 'ns' and value >= 1000:
-        return f"{value / 1000:.2f}us"
-    return f"{value:.2f}{unit}"
+    if unit == 'ns':
+        for divisor, suffix in _NS_SCALES:
+            if value >= divisor:
+                return "%.2f%s" % (value / divisor, suffix)
+    return "%.2f%s" % (value, unit)
 
 
 def generate_report(
-    regressions: list[dict],
-    improvements: list[dict],
-    unchanged: list[dict],
+    regressions: list[BenchmarkResult],
+    improvements: list[BenchmarkResult],
+    unchanged: list[BenchmarkResult],
     threshold: float
 ) -> str:
     """Generate markdown report."""
     lines = []
-    lines.append("## Performance Benchmark Report\n")
+    append = lines.append
+    append("## Performance Benchmark Report\n")
 
     # Summary first
     total = len(regressions) + len(improvements) + len(unchanged)
-    lines.append("### Summary\n")
-    lines.append(f"- **Total benchmarks**: {total}")
-    lines.append(f"- **Regressions**: {len(regressions)} :x:" if regressions else f"- **Regressions**: 0 :white_check_mark:")
-    lines.append(f"- **Improvements**: {len(improvements)}")
-    lines.append(f"- **Unchanged**: {len(unchanged)} (within {threshold*100:.0f}% threshold)")
-    lines.append("")
+    append("### Summary\n")
+    append(f"- **Total benchmarks**: {total}")
+    append(f"- **Regressions**: {len(regressions)} :x:" if regressions else f"- **Regressions**: 0 :white_check_mark:")
+    append(f"- **Improvements**: {len(improvements)}")
+    append(f"- **Unchanged**: {len(unchanged)} (within {threshold*100:.0f}% threshold)")
+    append("")
 
     # Regressions (if any)
     if regressions:
-        lines.append(f"### :x: Regressions (>{threshold*100:.0f}% slower)\n")
-        lines.append("| Benchmark | Base | PR | Change |")
-        lines.append("|-----------|------|-----|--------|")
-        for r in sorted(regressions, key=lambda x: x['change'], reverse=True):
-            base_str = format_time(r['base_time'], r['time_unit'])
-            pr_str = format_time(r['pr_time'], r['time_unit'])
-            lines.append(f"| `{r['name']}` | {base_str} | {pr_str} | **+{r['change_pct']:.1f}%** :warning: |")
-        lines.append("")
+        append(f"### :x: Regressions (>{threshold*100:.0f}% slower)\n")
+        append("| Benchmark | Base | PR | Change |")
+        append("|-----------|------|-----|--------|")
+        lines.extend([
+            _REGRESSION_ROW % (
+                r.name,
+                format_time(r.base_time, r.time_unit),
+                format_time(r.pr_time, r.time_unit),
+                r.change * 100,
+            )
+            for r in regressions
+        ])
+        append("")
 
     # Improvements (if any)
     if improvements:
-        lines.append(f"### :rocket: Improvements (>{threshold*100:.0f}% faster)\n")
-        lines.append("| Benchmark | Base | PR | Change |")
-        lines.append("|-----------|------|-----|--------|")
-        for i in sorted(improvements, key=lambda x: x['change']):
-            base_str = format_time(i['base_time'], i['time_unit'])
-            pr_str = format_time(i['pr_time'], i['time_unit'])
-            lines.append(f"| `{i['name']}` | {base_str} | {pr_str} | **{i['change_pct']:.1f}%** :chart_with_downwards_trend: |")
-        lines.append("")
+        append(f"### :rocket: Improvements (>{threshold*100:.0f}% faster)\n")
+        append("| Benchmark | Base | PR | Change |")
+        append("|-----------|------|-----|--------|")
+        lines.extend([
+            _IMPROVEMENT_ROW % (
+                i.name,
+                format_time(i.base_time, i.time_unit),
+                format_time(i.pr_time, i.time_unit),
+                i.change * 100,
+            )
+            for i in improvements
+        ])
+        append("")
 
     # Result status
-    lines.append("---")
+    append("---")
     if regressions:
-        lines.append(":x: **Status**: Performance regressions detected. Please review the changes above.")
+        append(":x: **Status**: Performance regressions detected. Please review the changes above.")
     else:
-        lines.append(":white_check_mark: **Status**: No significant performance regressions detected.")
+        append(":white_check_mark: **Status**: No significant performance regressions detected.")
 
     return "\n".join(lines)
 
@@ -205,7 +252,7 @@ def main():
         Path('regression_detected').touch()
         print(f"REGRESSION DETECTED: {len(regressions)} benchmark(s) slower than {args.threshold*100:.0f}% threshold")
         for r in regressions:
-            print(f"  - {r['name']}: +{r['change_pct']:.1f}%")
+            print(f"  - {r.name}: +{r.change * 100:.1f}%")
         sys.exit(1)
 
     print(f"No significant regressions detected (threshold: {args.threshold*100:.0f}%)")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Tests for compare_benchmarks.py.
+
+Run from the repository root:
+    python3 -m unittest discover -s scripts/tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import compare_benchmarks  # noqa: E402
+
+
+class LoadBenchmarksTest(unittest.TestCase):
+    def test_nan_counters_are_accepted(self):
+        # cv aggregates carry bare NaN counters, which orjson rejects
+        benchmarks = compare_benchmarks.load_benchmarks(
+            str(FIXTURES_DIR / 'nan_counters.json'))
+        self.assertEqual(benchmarks['BM_Pool_Allocate'], (125.0, 'ns'))
+
+    def test_only_trailing_aggregate_suffix_is_skipped(self):
+        benchmarks = compare_benchmarks.load_benchmarks(
+            str(FIXTURES_DIR / 'nan_counters.json'))
+        self.assertEqual(sorted(benchmarks), ['BM_Pool_Allocate', 'BM_cv_parse/8'])
+
+    def test_repository_baselines_load(self):
+        for baseline in sorted((SCRIPTS_DIR.parent / 'benchmarks' / 'baselines').glob('*.json')):
+            with self.subTest(baseline=baseline.name):
+                compare_benchmarks.load_benchmarks(str(baseline))
+
+
+if __name__ == '__main__':
+    unittest.main()